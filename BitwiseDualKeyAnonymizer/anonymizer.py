@@ -8,7 +8,7 @@ Key Features:
 1. Dual-key architecture for enhanced security
 2. Position-aware byte transformation using bitwise operations
 3. Complete type preservation
-4. Database-friendly base36 output
+4. Database-friendly base32 output
 5. Perfect reversibility
 
 Security Model:
@@ -23,12 +23,140 @@ Version: 1.0
 
 from __future__ import annotations  # Enable modern type hints
 
+import re  # For token parsing
 import secrets  # For generating secure random keys
+from base64 import b32decode, b32encode  # For token payload encoding
 from decimal import Decimal  # For precise decimal numbers
 from enum import Enum  # For type classification
-from hashlib import sha256, sha512  # For key sequence generation
+from hashlib import shake_128, shake_256  # For key sequence generation
 from typing import override  # For method override annotation
 
+import numpy as np  # For whole-array byte transformation
+
+try:  # Numba is optional - without it the NumPy implementation is used
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+# Inputs at least this long are worth spreading over several threads
+PARALLEL_MIN_LENGTH = 4096
+
+# Inputs at least this long are processed as uint64 words (SWAR)
+SWAR_MIN_LENGTH = 65536
+
+# Inputs up to this long are transformed with per-position lookup tables,
+# which take 256 bytes per position and direction
+LUT_MAX_LENGTH = 1024
+
+
+def _lane_word(lane_bytes: list[int]) -> np.uint64:
+    """Pack 8 per-lane byte values (in memory order) into one uint64."""
+    return np.frombuffer(bytes(lane_bytes), dtype=np.uint64)[0]
+
+
+# SWAR masks. A uint64 word holds 8 consecutive positions and words start
+# at multiples of 8, so byte lane k always holds a position with pos % 8 == k.
+_LOW_NIBBLES = _lane_word([0x0F] * 8)
+_HIGH_NIBBLES = _lane_word([0xF0] * 8)
+
+# Bits of every byte that stay in place when rotating right by 1, 2 or 4
+_ROTATION_KEEP = {shift: _lane_word([0xFF >> shift] * 8) for shift in (1, 2, 4)}
+
+# Lanes whose rotation amount contains the given power of two. Rotating
+# left by k is the same as rotating right by (8 - k) % 8.
+_ROTATION_SELECT = {
+    reverse: {
+        shift: _lane_word([0xFF if amount & shift else 0 for amount in amounts])
+        for shift in (1, 2, 4)
+    }
+    for reverse, amounts in (
+        (False, list(range(8))),
+        (True, [(8 - lane) % 8 for lane in range(8)]),
+    )
+}
+
+
+def _rotate_lanes(words: np.ndarray, *, reverse: bool) -> np.ndarray:
+    """Rotate byte lane k of every word right by k (left when reversing).
+
+    Works like a barrel shifter: each stage rotates all lanes by 1, 2 or 4
+    bits and keeps the result only in lanes whose amount has that bit set.
+    """
+    for shift, select in _ROTATION_SELECT[reverse].items():
+        keep = _ROTATION_KEEP[shift]
+        rotated = ((words >> shift) & keep) | ((words << (8 - shift)) & ~keep)
+        words = words ^ ((words ^ rotated) & select)
+    return words
+
+
+def _full_transform(
+    data_arr: np.ndarray,
+    prim_arr: np.ndarray,
+    sec_arr: np.ndarray,
+    reverse: bool,
+) -> np.ndarray:
+    """Transform every byte using both keys and its position.
+
+    Transformation layers (applied in reverse order when `reverse` is set):
+    1. XOR with primary key sequence
+    2. Position-based circular bit rotation to the right
+    3. XOR with position-modified secondary key
+    4. XOR with a position mask built from primes 13 and 41
+    5. Nibble swap for odd positions
+
+    Written as a plain loop so Numba can compile it; every position is
+    independent, which lets `prange` split the work between threads.
+
+    Args:
+        data_arr: Input bytes as a uint8 array
+        prim_arr: Primary key sequence as a uint8 array
+        sec_arr: Secondary key sequence as a uint8 array
+        reverse: Whether to apply reverse transformation
+
+    Returns:
+        Transformed bytes as a uint8 array
+
+    """
+    n = data_arr.shape[0]
+    out = np.empty(n, dtype=np.uint8)
+
+    for pos in prange(n):
+        primary_mask = np.int64(prim_arr[pos % prim_arr.shape[0]])
+        position_key = (np.int64(sec_arr[pos % sec_arr.shape[0]]) + pos) & 0xFF
+        scramble_mask = (pos * 13 + 41) & 0xFF
+        rotation = pos & 7
+        odd_mask = -(pos & 1) & 0xFF  # 0xFF for odd positions, 0 for even
+
+        # Work on int64 so the shifts never wrap around inside uint8
+        result = np.int64(data_arr[pos])
+
+        if not reverse:
+            result ^= primary_mask
+            result = ((result >> rotation) | (result << (8 - rotation))) & 0xFF
+            result ^= position_key
+            result ^= scramble_mask
+            swapped = ((result & 0x0F) << 4) | ((result & 0xF0) >> 4)
+            result ^= (result ^ swapped) & odd_mask  # Branchless swap
+        else:
+            swapped = ((result & 0x0F) << 4) | ((result & 0xF0) >> 4)
+            result ^= (result ^ swapped) & odd_mask
+            result ^= scramble_mask
+            result ^= position_key
+            result = ((result << rotation) | (result >> (8 - rotation))) & 0xFF
+            result ^= primary_mask
+
+        out[pos] = result
+
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _full_transform_serial = njit(cache=True)(_full_transform)
+    _full_transform_parallel = njit(parallel=True, cache=True)(_full_transform)
+
 
 class DataType(Enum):
     """Enumeration of supported data types with their markers.
@@ -59,6 +187,10 @@ class BitwiseDualKeyAnonymizer:
     4. Non-linear transformations
     """
 
+    # Leading payload byte. Version 1 payloads used SHA-2 derived key
+    # sequences and cannot be restored with the SHAKE-derived ones.
+    PAYLOAD_VERSION = 2
+
     def __init__(
         self,
         primary_key: str | bytes,
@@ -71,8 +203,8 @@ class BitwiseDualKeyAnonymizer:
             secondary_key: Key for positional encoding
 
         The keys are processed differently:
-        - Primary key uses SHA-256 (faster, suitable for main transform)
-        - Secondary key uses SHA-512 (more complex, better for positional encoding)
+        - Primary key uses SHAKE128 (faster, suitable for main transform)
+        - Secondary key uses SHAKE256 (more complex, better for positional encoding)
 
         """
         # Convert string keys to bytes if needed
@@ -90,228 +222,271 @@ class BitwiseDualKeyAnonymizer:
         # Generate different sequences for different purposes
         self.primary_sequence = self._generate_sequence(
             self.primary_key,
-            sha256,
+            shake_128,
         )
         self.secondary_sequence = self._generate_sequence(
             self.secondary_key,
-            sha512,
+            shake_256,
         )
 
+        # Key sequences as arrays for the vectorized transformation
+        self._prim_arr = np.frombuffer(self.primary_sequence, dtype=np.uint8)
+        self._sec_arr = np.frombuffer(self.secondary_sequence, dtype=np.uint8)
+
+        # Per-position mask tables, grown lazily by _ensure_mask_tables
+        self._mask_cache_len = 0
+        self._ensure_mask_tables(64)  # Enough for typical short values
+
+        # Per-position lookup tables for short inputs, built lazily by _get_lut
+        self._lut: dict[bool, np.ndarray] = {}
+
     def _generate_sequence(
         self,
         key: bytes,
-        hash_func: sha256 | sha512,
+        hash_func: shake_128 | shake_256,
         length: int = 2048,
     ) -> bytes:
-        """Generate a pseudorandom byte sequence from a key using cryptographic hashing.
+        """Generate a pseudorandom byte sequence from a key using an XOF.
 
-        Process:
-        1. Start with the key
-        2. Repeatedly hash(previous_hash + key)
-        3. Collect bytes until desired length
+        SHAKE is an extendable-output function, so the whole sequence is
+        squeezed out of a single hash call instead of chaining many
+        fixed-size digests.
 
         Args:
             key: Seed key for sequence generation
-            hash_func: Hash function to use (sha256/sha512)
+            hash_func: Extendable-output function to use (shake_128/shake_256)
             length: Desired sequence length
 
         Returns:
             Deterministic byte sequence based on key
 
         """
-        result = bytearray()
-        current_hash = key
+        return hash_func(key).digest(length)
 
-        while len(result) < length:
-            # Create new hash combining previous hash with key
-            current_hash = hash_func(current_hash + key).digest()
-            result.extend(current_hash)
+    def _ensure_mask_tables(self, length: int) -> None:
+        """Make sure the per-position mask tables cover `length` positions.
 
-        return bytes(result[:length])
-
-    def _bitwise_transform_byte(
-        self,
-        byte: int,
-        position: int,
-        *,
-        reverse: bool = False,
-    ) -> int:
-        """Transform a single byte using multiple bitwise operations.
-
-        Transformation layers:
-        1. XOR with primary key sequence (reversible via second XOR)
-        2. Position-based circular bit rotation (reversible by rotating opposite direction)
-        3. XOR with position-modified secondary key
+        The masks depend only on the position and the keys, so they are
+        computed once and reused by every call. Tables grow to the next
+        power of two, which keeps the number of rebuilds logarithmic in the
+        longest input seen.
 
         Args:
-            byte: Input byte to transform
-            position: Byte position in data
-            reverse: Whether to apply reverse transformation
+            length: Number of positions that must be covered
 
-        Returns:
-            Transformed byte
+        """
+        if length <= self._mask_cache_len:
+            return
 
-        Security features:
-        - Each byte is transformed differently based on position
-        - Both keys influence the transformation
-        - Non-linear operations through rotation
+        size = 1 << (length - 1).bit_length()
+        pos = np.arange(size, dtype=np.int64)
 
-        """
-        # Get masks from both sequences
-        primary_mask = self.primary_sequence[
-            position % len(self.primary_sequence)
-        ]
-        secondary_mask = self.secondary_sequence[
-            position % len(self.secondary_sequence)
-        ]
+        self._primary_table = self._prim_arr[pos % len(self._prim_arr)]
+        secondary_mask = self._sec_arr[pos % len(self._sec_arr)]
+        self._pos_key_table = ((secondary_mask + pos) & 0xFF).astype(np.uint8)
+        self._scramble_mask = ((pos * 13 + 41) & 0xFF).astype(np.uint8)
+        self._rot_table = (pos & 7).astype(np.uint16)
+        self._odd_mask = (-(pos & 1) & 0xFF).astype(np.uint8)
+        self._mask_cache_len = size
 
-        if not reverse:
-            # Forward transformation
-            result = byte ^ primary_mask  # First layer: XOR with primary key
+    def _get_lut(self, length: int, *, reverse: bool = False) -> np.ndarray:
+        """Get a lookup table mapping (position, byte) to transformed byte.
 
-            # Second layer: rotate bits right
-            rotation = position % 8  # Keep within byte bounds
-            result = ((result >> rotation) | (result << (8 - rotation))) & 0xFF
+        Every layer is a fixed function of the position and the byte value,
+        so all 256 possible bytes are transformed once per position and the
+        transformation itself becomes a single gather. The table grows to
+        the next power of two when a longer input shows up; rows do not
+        depend on the input length, so one table serves every length.
 
-            # Third layer: XOR with position-dependent secondary key
-            position_key = (secondary_mask + position) & 0xFF
-            result ^= position_key
+        Args:
+            length: Number of positions that must be covered
+            reverse: Whether to get the table for the reverse transformation
 
-        else:
-            # Reverse transformation (operations in reverse order)
-            position_key = (secondary_mask + position) & 0xFF
-            result = byte ^ position_key  # Reverse third layer
+        Returns:
+            uint8 array of shape (positions, 256), at least `length` rows
 
-            # Reverse second layer (rotate left instead of right)
-            rotation = position % 8
-            result = ((result << rotation) | (result >> (8 - rotation))) & 0xFF
+        """
+        lut = self._lut.get(reverse)
+        if lut is None or length > len(lut):
+            size = 1 << max(length - 1, 63).bit_length()
+            all_bytes = np.broadcast_to(
+                np.arange(256, dtype=np.uint8),
+                (size, 256),
+            )
+            lut = self._numpy_transform(all_bytes, reverse=reverse)
+            self._lut[reverse] = lut
 
-            result ^= primary_mask  # Reverse first layer
+        return lut
 
-        return result
+    def _transform(self, data: bytes, *, reverse: bool = False) -> np.ndarray:
+        """Transform a whole byte sequence.
 
-    def _positional_bit_scramble(
-        self,
-        byte: int,
-        position: int,
-        *,
-        reverse: bool = False,
-    ) -> int:
-        """Additional bit manipulation based on byte position.
+        Uses the Numba-compiled `_full_transform` kernel when Numba is
+        installed. Otherwise short inputs go through the per-position lookup
+        tables and longer ones through the NumPy implementation. All paths
+        produce identical output.
 
-        Operations:
-        1. XOR with position-based mask
-        2. Conditional nibble swap for odd positions
+        The result is returned as an array so callers can slice it before
+        the one copy into `bytes`.
 
         Args:
-            byte: Input byte
-            position: Byte position
-            reverse: Whether to reverse the transformation
+            data: Input bytes
+            reverse: Whether to apply reverse transformation
 
         Returns:
-            Scrambled byte
-
-        Design rationale:
-        - Adds complexity without excessive computation
-        - Position dependency prevents pattern recognition
-        - Fully reversible operations
+            Transformed bytes as a uint8 array
 
         """
-        # Create position-dependent mask using prime numbers
-        mask = (position * 13 + 41) & 0xFF  # 13 and 41 are primes
-
-        if not reverse:
-            # Forward scrambling
-            result = byte ^ mask  # XOR with position mask
-            if position & 1:  # For odd positions
-                # Swap high and low 4 bits
-                result = ((result & 0x0F) << 4) | ((result & 0xF0) >> 4)
+        data_arr = np.frombuffer(data, dtype=np.uint8)
+        n = len(data_arr)
+
+        if NUMBA_AVAILABLE:
+            kernel = (
+                _full_transform_parallel
+                if n >= PARALLEL_MIN_LENGTH
+                else _full_transform_serial
+            )
+            result = kernel(data_arr, self._prim_arr, self._sec_arr, reverse)
+        elif n <= LUT_MAX_LENGTH:
+            lut = self._get_lut(n, reverse=reverse)
+            result = lut[np.arange(n), data_arr]
         else:
-            # Reverse scrambling
-            if position & 1:  # For odd positions
-                # Reverse nibble swap
-                byte = ((byte & 0x0F) << 4) | ((byte & 0xF0) >> 4)
-            result = byte ^ mask  # Reverse XOR
+            result = self._numpy_transform(data_arr, reverse=reverse)
 
         return result
 
-    def _to_base36(self, number: int) -> str:
-        """Convert integer to base36 string (0-9 and A-Z).
+    def _numpy_transform(
+        self,
+        data_arr: np.ndarray,
+        *,
+        reverse: bool = False,
+    ) -> np.ndarray:
+        """Transform a byte array using NumPy array operations.
+
+        Array equivalent of `_full_transform`: all positions are processed
+        in one pass of uint8/uint16 operations instead of a per-byte loop.
+        Long inputs are handed to `_swar_transform`.
 
-        Process:
-        1. Repeatedly divide by 36
-        2. Map remainders to alphanumeric chars
-        3. Reverse resulting string
+        The first axis is the position; any further axes hold several
+        values transformed for that same position (used to build the
+        lookup tables).
 
         Args:
-            number: Integer to convert
+            data_arr: Input bytes as a uint8 array
+            reverse: Whether to apply reverse transformation
 
         Returns:
-            Base36 string representation
-
-        Why base36?
-        - Alphanumeric only (database-friendly)
-        - Case-insensitive (robust)
-        - More compact than hex
+            Transformed bytes as a uint8 array
 
         """
-        alphabet = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        if number == 0:
-            return "0"
+        n = len(data_arr)
+        if n >= SWAR_MIN_LENGTH and data_arr.ndim == 1:
+            return self._swar_transform(data_arr, reverse=reverse)
+
+        self._ensure_mask_tables(n)
+        shape = (n,) + (1,) * (data_arr.ndim - 1)
+        primary_mask = self._primary_table[:n].reshape(shape)
+        position_key = self._pos_key_table[:n].reshape(shape)
+        scramble_mask = self._scramble_mask[:n].reshape(shape)
+        rotation = self._rot_table[:n].reshape(shape)
+        odd = self._odd_mask[:n].reshape(shape)
+
+        # uint16 leaves room for the left shift of the rotation
+        result = data_arr.astype(np.uint16)
 
-        base36 = ""
-        while number:
-            number, i = divmod(number, 36)
-            base36 = alphabet[i] + base36
+        if not reverse:
+            result ^= primary_mask
+            result = ((result >> rotation) | (result << (8 - rotation))) & 0xFF
+            result ^= position_key
+            result ^= scramble_mask
+            swapped = ((result & 0x0F) << 4) | ((result & 0xF0) >> 4)
+            result ^= (result ^ swapped) & odd  # Swap only where odd is 0xFF
+        else:
+            swapped = ((result & 0x0F) << 4) | ((result & 0xF0) >> 4)
+            result ^= (result ^ swapped) & odd
+            result ^= scramble_mask
+            result ^= position_key
+            result = ((result << rotation) | (result >> (8 - rotation))) & 0xFF
+            result ^= primary_mask
 
-        return base36
+        return result.astype(np.uint8)
 
-    def _from_base36(self, base36_str: str) -> int:
-        """Convert base36 string back to integer.
+    def _swar_transform(
+        self,
+        data_arr: np.ndarray,
+        *,
+        reverse: bool = False,
+    ) -> np.ndarray:
+        """Transform a byte array 8 bytes at a time as uint64 words.
 
-        Process:
-        For a string like 'ABC':
-        - A * 36² + B * 36¹ + C * 36⁰
+        Every layer is byte-parallel, so the input is padded to a multiple
+        of 8 and processed as uint64 words, with the mask tables viewed the
+        same way. The position-dependent rotation is done per lane by
+        `_rotate_lanes`. Each NumPy call then covers 8 bytes per element,
+        which pays off on long inputs; the extra rotation stages make it
+        slower than the byte path for short ones.
 
         Args:
-            base36_str: Base36 encoded string
+            data_arr: Input bytes as a uint8 array
+            reverse: Whether to apply reverse transformation
 
         Returns:
-            Original integer value
-
-        Security note:
-        Uses built-in int() with base 36, which validates input
-        and raises ValueError for invalid characters.
+            Transformed bytes as a uint8 array
 
         """
-        return int(base36_str, 36)
+        n = len(data_arr)
+        padded = (n + 7) & ~7
+        self._ensure_mask_tables(padded)
+        primary_mask = self._primary_table[:padded].view(np.uint64)
+        position_key = self._pos_key_table[:padded].view(np.uint64)
+        scramble_mask = self._scramble_mask[:padded].view(np.uint64)
+        odd = self._odd_mask[:padded].view(np.uint64)
+
+        buffer = np.zeros(padded, dtype=np.uint8)
+        buffer[:n] = data_arr
+        words = buffer.view(np.uint64)
 
-    def _bytes_to_base36(self, data: bytes) -> str:
-        """Convert byte sequence to base36 string.
+        if not reverse:
+            words ^= primary_mask
+            words = _rotate_lanes(words, reverse=False)
+            words ^= position_key
+            words ^= scramble_mask
+            swapped = ((words & _LOW_NIBBLES) << 4) | ((words & _HIGH_NIBBLES) >> 4)
+            words ^= (words ^ swapped) & odd
+        else:
+            swapped = ((words & _LOW_NIBBLES) << 4) | ((words & _HIGH_NIBBLES) >> 4)
+            words ^= (words ^ swapped) & odd
+            words ^= scramble_mask
+            words ^= position_key
+            words = _rotate_lanes(words, reverse=True)
+            words ^= primary_mask
+
+        return words.view(np.uint8)[:n]
+
+    def _bytes_to_base32(self, data: bytes) -> str:
+        """Convert byte sequence to base32 string (A-Z and 2-7).
 
-        Process:
-        1. Convert bytes to large integer (big-endian)
-        2. Convert integer to base36
+        Encoding runs in C and is linear in the input length. Padding is
+        stripped because it can be recomputed from the string length.
 
         Args:
             data: Byte sequence to convert
 
         Returns:
-            Base36 string representation
+            Base32 string representation without padding
 
-        Note:
-        Big-endian is used for consistent cross-platform behavior
+        Why base32?
+        - Alphanumeric only (database-friendly)
+        - Case-insensitive (robust)
+        - Keeps leading zero bytes
 
         """
-        number = int.from_bytes(data, byteorder="big")
-        return self._to_base36(number)
+        return b32encode(data).decode("ascii").rstrip("=")
 
-    def _base36_to_bytes(self, base36_str: str) -> bytes:
-        """Convert base36 string to bytes."""
-        number = self._from_base36(base36_str)
-        # Calculate minimum bytes needed
-        byte_length = (number.bit_length() + 7) // 8
-        return number.to_bytes(byte_length, byteorder="big")
+    def _base32_to_bytes(self, base32_str: str) -> bytes:
+        """Convert unpadded base32 string to bytes."""
+        padding = "=" * (-len(base32_str) % 8)
+        return b32decode(base32_str + padding, casefold=True)
 
     def anonymize(self, data: str | bytes) -> str:
         """Anonymize input data using dual-key transformation.
@@ -321,13 +496,13 @@ class BitwiseDualKeyAnonymizer:
         2. Add version byte for future compatibility
         3. Apply bitwise transformation to each byte
         4. Apply position-aware scrambling
-        5. Convert to base36 with length prefix
+        5. Convert to base32
 
         Args:
             data: Input data as string or bytes
 
         Returns:
-            Anonymized data as base36 string
+            Anonymized data as base32 string
 
         """
         # Handle string input
@@ -336,71 +511,89 @@ class BitwiseDualKeyAnonymizer:
 
         # print(f"Data: {data}")
 
-        # Add version byte for future algorithm updates
-        version = b"\x01"  # Version 1 of the algorithm
-        data = version + data
-
-        result = bytearray()
+        # Add version byte, checked again on the way back
+        data = bytes((self.PAYLOAD_VERSION,)) + data
 
-        # Apply transformations byte by byte
-        for pos, byte in enumerate(data):
-            # Layer 1: Basic bitwise transformation
-            transformed = self._bitwise_transform_byte(byte, pos)
-            # Layer 2: Position-dependent scrambling
-            scrambled = self._positional_bit_scramble(transformed, pos)
-            result.append(scrambled)
+        # Apply both transformation layers to all bytes at once
+        result = self._transform(data)
 
         # print(f"Result: {result}")
 
-        return self._bytes_to_base36(bytes(result))
+        return self._bytes_to_base32(result.tobytes())
 
-    def deanonymize(self, base36_str: str) -> bytes:
+    def deanonymize(self, base32_str: str) -> bytes:
         """Reverse the anonymization process.
 
         Process flow:
-        1. Extract original length from prefix
-        2. Convert base36 to bytes
-        3. Reverse transformations in opposite order
-        4. Remove version byte
+        1. Convert base32 to bytes
+        2. Reverse transformations in opposite order
+        3. Remove version byte
 
         Args:
-            base36_str: Anonymized base36 string
+            base32_str: Anonymized base32 string
 
         Returns:
             Original data as bytes
 
         Security:
-        - Validates length prefix
         - Performs exact reverse of each transformation
-        - Checks version byte
+        - Checks version byte (ValueError on mismatch)
 
         """
-        anonymized_data = self._base36_to_bytes(base36_str)
-
-        result = bytearray()
-
-        # Reverse transformations byte by byte
-        for pos, byte in enumerate(anonymized_data):
-            # Reverse layer 2: Position-dependent scrambling
-            unscrambled = self._positional_bit_scramble(byte, pos, reverse=True)
-            # Reverse layer 1: Basic bitwise transformation
-            original = self._bitwise_transform_byte(
-                unscrambled,
-                pos,
-                reverse=True,
-            )
-            result.append(original)
+        return self._restore_bytes(self._base32_to_bytes(base32_str))
+
+    def _restore_bytes(self, anonymized_data: bytes) -> bytes:
+        """Reverse the byte transformation and drop the version byte.
+
+        Shared by every payload encoding, so decoders for older token
+        formats only need to produce the raw anonymized bytes.
+
+        Args:
+            anonymized_data: Anonymized bytes, version byte included
 
-        # Remove version byte and return
-        return bytes(result[1:])
+        Returns:
+            Original data as bytes
+
+        Raises:
+            ValueError: If the restored version byte is not PAYLOAD_VERSION,
+                i.e. the payload comes from another format or other keys
+
+        """
+        # Reverse both transformation layers for all bytes at once
+        result = self._transform(anonymized_data, reverse=True)
+
+        if len(result) == 0 or result[0] != self.PAYLOAD_VERSION:
+            raise ValueError("Unsupported payload version")
+
+        # Remove version byte before the single copy into bytes
+        return result[1:].tobytes()
 
 
 class TypeAwareDualKeyAnonymizer(BitwiseDualKeyAnonymizer):
     """Enhanced anonymizer that formats output as a structured token."""
 
-    TOKEN_VERSION = "1"  # For future versioning
+    TOKEN_VERSION = "3"  # Version 3: base32 payload, type only in the marker
+    # Decode only: 2 - base32 payload that repeats the type as a "X:" prefix.
+    # Version 1 tokens (base36, SHA-2 key sequences) are not supported.
+    LEGACY_TOKEN_VERSIONS = ("2",)
     TOKEN_PREFIX = "TKN"  # Token identifier
 
+    # Validates a token and captures version, type marker and payload
+    _TOKEN_RE = re.compile(
+        rf"{TOKEN_PREFIX}_V(\d+)_([{''.join(dt.value for dt in DataType)}])"
+        r"([0-9A-Za-z]+)",
+    )
+
+    @override
+    def __init__(
+        self,
+        primary_key: str | bytes,
+        secondary_key: str | bytes,
+    ) -> None:
+        """Initialize the anonymizer and precompute the constant token header."""
+        super().__init__(primary_key, secondary_key)
+        self._token_header = f"{self.TOKEN_PREFIX}_V{self.TOKEN_VERSION}_"
+
     def _serialize_with_type(self, data: object) -> tuple[str, DataType]:
         """Convert Python object to string while preserving type information.
 
@@ -451,54 +644,59 @@ class TypeAwareDualKeyAnonymizer(BitwiseDualKeyAnonymizer):
             case DataType.NONE:
                 return None
             case DataType.BOOL:
-                return bool(int(data[2:]))
+                return bool(int(data))
             case DataType.INT:
-                return int(data[2:])
+                return int(data)
             case DataType.FLOAT:
-                return float(data[2:])
+                return float(data)
             case DataType.DECIMAL:
-                return Decimal(data[2:])
+                return Decimal(data)
             case _:
-                return data[2:]
+                return data
 
     def _create_token(self, type_marker: str, data: str) -> str:
         """Create a structured token from components.
 
-        Format: TKN_V1_TYPEBASE36DATA
-        Example: TKN_V1_IBASE36DATA
+        Format: TKN_V3_TYPEBASE32DATA
+        Example: TKN_V3_IBASE32DATA
         """
-        return f"{self.TOKEN_PREFIX}_V{self.TOKEN_VERSION}_{type_marker}{data}"
+        return self._token_header + type_marker + data
 
     def _parse_token(self, token: str) -> tuple[str, str, str]:
-        """Parse token into components."""
-        try:
-            parts = token.split("_")
-            if len(parts) != 3 or parts[0] != self.TOKEN_PREFIX:
-                raise ValueError("Invalid token format")
-
-            _, version, combined_data = parts
-            type_marker, data = combined_data[0], combined_data[1:]
-            if version != f"V{self.TOKEN_VERSION}":
-                raise ValueError(f"Unsupported token version: {version}")
-        except Exception as e:
-            raise ValueError(f"Invalid token format: {e!s}")
-        else:
-            return type_marker, data
+        """Parse token into version, type marker and payload.
+
+        A single precompiled regex validates the layout and extracts all
+        components in one match.
+        """
+        match = (
+            self._TOKEN_RE.fullmatch(token) if isinstance(token, str) else None
+        )
+        if match is None:
+            raise ValueError("Invalid token format")
+
+        version, type_marker, data = match.groups()
+        if version not in (self.TOKEN_VERSION, *self.LEGACY_TOKEN_VERSIONS):
+            raise ValueError(
+                f"Invalid token format: Unsupported token version: V{version}",
+            )
+        return version, type_marker, data
 
     @override
     def anonymize(self, data: object) -> str:
         """Anonymize data and return as structured token.
 
         Example outputs:
-        - Integer: TKN_V1_IBASE36DATA
-        - String:  TKN_V1_SBASE36DATA
-        - Float:   TKN_V1_FBASE36DATA
+        - Integer: TKN_V3_IBASE32DATA
+        - String:  TKN_V3_SBASE32DATA
+        - Float:   TKN_V3_FBASE32DATA
+
+        The type is carried by the token marker only, so the anonymized
+        payload is just the serialized value.
         """
         # Get basic anonymization
         serialized, data_type = self._serialize_with_type(data)
-        data_with_type = f"{data_type.value}:{serialized}"
-        # print(f"Serialized: {data_with_type}")
-        anonymized = super().anonymize(data_with_type)
+        # print(f"Serialized: {serialized}")
+        anonymized = super().anonymize(serialized)
         # print(f"Anonymized: {anonymized}")
 
         # print(f"Tokenized: {self._create_token(data_type.value, anonymized)}")
@@ -508,16 +706,21 @@ class TypeAwareDualKeyAnonymizer(BitwiseDualKeyAnonymizer):
 
     @override
     def deanonymize(self, token: str) -> object:
-        """Deanonymize from structured token format."""
+        """Deanonymize from structured token format.
+
+        Legacy version 2 tokens are still accepted. Version 1 tokens were
+        built from SHA-2 key sequences and are rejected as unsupported.
+        """
         # Parse token
-        type_marker, data = self._parse_token(token)
+        version, type_marker, data = self._parse_token(token)
 
-        # Reconstruct original anonymized format
-        anonymized = data
+        anonymized_data = self._base32_to_bytes(data)
 
         data_type = DataType(type_marker)
 
-        typed_data = super().deanonymize(anonymized).decode()
+        typed_data = self._restore_bytes(anonymized_data).decode()
+        if version in self.LEGACY_TOKEN_VERSIONS:
+            typed_data = typed_data[2:]  # Drop the "X:" type prefix
 
         return self._deserialize_with_type(typed_data, data_type)
 
@@ -539,7 +742,7 @@ if __name__ == "__main__":
         "A" * 100,  # Test longer string
     ]
 
-    print("Testing Base36 Anonymization:")
+    print("Testing Base32 Anonymization:")
     print("-" * 60)
 
     for test_data in test_cases:
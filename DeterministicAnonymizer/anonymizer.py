@@ -6,14 +6,26 @@ import pandas as pd
 
 
 class DeterministicAnonymizer:
+    # Initial length of the per-field offset streams used for text
+    TEXT_STREAM_LENGTH = 256
+
     def __init__(self, key: str):
         """Initialize anonymizer with a secret key."""
         self.key = key.encode("utf-8")
+        self._text_stream: Dict[str, np.ndarray] = {}
+        self._phase_cache: Dict[str, float] = {}
+        self._seed_cache: Dict[str, int] = {}
 
     def _generate_seed(self, field_name: str) -> int:
         """Generate a deterministic seed for a field based on the key and field name."""
+        if field_name in self._seed_cache:
+            return self._seed_cache[field_name]
+
         h = hashlib.sha256(self.key + field_name.encode("utf-8"))
-        return int(h.hexdigest(), 16) % (2**32)
+        # Last 4 bytes of the digest, same as the hex digest modulo 2**32
+        seed = int.from_bytes(h.digest()[-4:], "big")
+        self._seed_cache[field_name] = seed
+        return seed
 
     def _generate_numeric_noise(
         self,
@@ -23,11 +35,13 @@ class DeterministicAnonymizer:
         frequency: float,
     ) -> np.ndarray:
         """Generate deterministic sinusoidal noise for numeric values."""
-        seed = self._generate_seed(field_name)
         indices = np.arange(len(values))
 
         # Generate deterministic phase based on the field's seed
-        phase = np.random.RandomState(seed).rand() * 2 * np.pi
+        phase = self._phase_cache.get(field_name)
+        if phase is None:
+            seed = self._generate_seed(field_name)
+            phase = self._phase_cache[field_name] = seed / 2**32 * 2 * np.pi
 
         # Generate sinusoidal noise
         noise = amplitude * np.sin(frequency * indices + phase)
@@ -35,6 +49,70 @@ class DeterministicAnonymizer:
         # Ensure the noise maintains the original dtype
         return noise.astype(values.dtype)
 
+    def _text_offsets(self, field_name: str, length: int) -> np.ndarray:
+        """Get the per-position character offsets for a text field.
+
+        The offsets come from a SHAKE-128 stream keyed by the secret key and
+        field name, cached per field and grown when a longer text shows up.
+        SHAKE output is a prefix of any longer output, so growing the stream
+        keeps earlier offsets unchanged.
+        """
+        stream = self._text_stream.get(field_name)
+        if stream is None or len(stream) < length:
+            stream_length = max(
+                self.TEXT_STREAM_LENGTH,
+                1 << (length - 1).bit_length(),
+            )
+            h = hashlib.shake_128(self.key + field_name.encode("utf-8"))
+            # One 32-bit word per position keeps the modulo bias negligible,
+            # reduced modulo the size of the readable ASCII range (94)
+            words = np.frombuffer(h.digest(stream_length * 4), dtype="<u4")
+            stream = words % 94
+            self._text_stream[field_name] = stream
+        return stream[:length]
+
+    def _shift_char_codes(
+        self,
+        char_codes: np.ndarray,
+        offsets: np.ndarray,
+        reverse: bool = False,
+    ) -> np.ndarray:
+        """Apply the character substitution to an array of code points.
+        Only uses readable ASCII characters (letters, numbers, and basic punctuation).
+        """
+        # Define the range of readable ASCII characters
+        # 33-126 covers printable characters: ! through ~
+        CHAR_RANGE = 94  # 126 - 33 + 1
+        CHAR_START = 33  # '!' character
+
+        if not reverse:
+            # Forward transformation: every code is first folded into the
+            # readable range, so readable characters keep their place and
+            # anything else lands in the range too, without branching.
+            # Characters from outside the range can't be properly reversed.
+            base = (char_codes - CHAR_START) % CHAR_RANGE
+            return (base + offsets) % CHAR_RANGE + CHAR_START
+
+        # Reverse transformation (anonymized text only holds readable characters)
+        return (char_codes - CHAR_START - offsets) % CHAR_RANGE + CHAR_START
+
+    @staticmethod
+    def _to_char_codes(text: str) -> np.ndarray:
+        """Get the code points of all characters of a string at once."""
+        return np.frombuffer(
+            text.encode("utf-32-le", "surrogatepass"),
+            dtype="<u4",
+        ).astype(np.int64)
+
+    @staticmethod
+    def _from_char_codes(char_codes: np.ndarray) -> str:
+        """Build a string from an array of code points."""
+        return (
+            char_codes.astype("<u4")
+            .tobytes()
+            .decode("utf-32-le", "surrogatepass")
+        )
+
     def _text_transform(
         self,
         text: str,
@@ -47,46 +125,52 @@ class DeterministicAnonymizer:
         if not isinstance(text, str):
             return text
 
-        seed = self._generate_seed(field_name)
-        result = []
+        offsets = self._text_offsets(field_name, len(text))
+        char_codes = self._to_char_codes(text)
+        return self._from_char_codes(
+            self._shift_char_codes(char_codes, offsets, reverse),
+        )
 
-        # Define the range of readable ASCII characters
-        # 33-126 covers printable characters: ! through ~
-        CHAR_RANGE = 94  # 126 - 33 + 1
-        CHAR_START = 33  # '!' character
+    def _text_transform_batch(
+        self,
+        series: pd.Series,
+        field_name: str,
+        reverse: bool = False,
+    ) -> pd.Series:
+        """Transform every string of a Series in one vectorized pass.
 
-        for i, char in enumerate(text):
-            # Generate deterministic hash for position
-            h = hashlib.sha256(f"{seed}_{i}".encode())
-            offset = int(h.hexdigest(), 16) % CHAR_RANGE
-
-            # Get the ASCII value of the current character
-            char_code = ord(char)
-
-            if not reverse:
-                # Forward transformation
-                if CHAR_START <= char_code <= 126:
-                    # If the character is in the readable range, transform within that range
-                    new_char_code = (
-                        (char_code - CHAR_START + offset) % CHAR_RANGE
-                    ) + CHAR_START
-                else:
-                    # If the character is outside our range, map it into the readable range
-                    new_char_code = (offset % CHAR_RANGE) + CHAR_START
-            # Reverse transformation
-            elif CHAR_START <= char_code <= 126:
-                # Reverse the transformation within the readable range
-                new_char_code = (
-                    (char_code - CHAR_START - offset + CHAR_RANGE) % CHAR_RANGE
-                ) + CHAR_START
-            else:
-                # If the character is outside our range, we can't properly reverse it
-                # This should not happen if the text was encrypted with this same system
-                new_char_code = char_code
-
-            result.append(chr(new_char_code))
-
-        return "".join(result)
+        All strings are concatenated, transformed as a single code point
+        array using each character's position within its own string, and
+        cut back at the original lengths. Non-string values (e.g. NaN) are
+        passed through unchanged, same as in _text_transform.
+        """
+        values = series.to_numpy(dtype=object, copy=True)
+        is_text = np.fromiter(
+            (isinstance(value, str) for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+        texts = values[is_text]
+        if len(texts) == 0:
+            return pd.Series(values, index=series.index, name=series.name)
+
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+
+        # Position of every character within the string it came from
+        positions = np.arange(ends[-1]) - np.repeat(starts, lengths)
+        offsets = self._text_offsets(field_name, int(lengths.max()))[positions]
+
+        char_codes = self._to_char_codes("".join(texts))
+        transformed = self._from_char_codes(
+            self._shift_char_codes(char_codes, offsets, reverse),
+        )
+
+        values[is_text] = [
+            transformed[start:end] for start, end in zip(starts, ends)
+        ]
+        return pd.Series(values, index=series.index, name=series.name)
 
     def anonymize(
         self,
@@ -104,7 +188,9 @@ class DeterministicAnonymizer:
             }
         }
         """
-        result = df.copy()
+        # Shallow copy: untouched columns share data with the input, and
+        # assigning a configured column replaces it only in the result
+        result = df.copy(deep=False)
 
         for field_name, field_config in config.items():
             if field_name not in df.columns:
@@ -122,9 +208,10 @@ class DeterministicAnonymizer:
                 result[field_name] = values + noise
 
             elif field_config["type"] == "text":
-                # Vectorize the text transformation
-                result[field_name] = df[field_name].apply(
-                    lambda x: self._text_transform(x, field_name),
+                # Transform the whole column in one pass
+                result[field_name] = self._text_transform_batch(
+                    df[field_name],
+                    field_name,
                 )
 
         return result
@@ -135,7 +222,9 @@ class DeterministicAnonymizer:
         config: Dict[str, Dict[str, Any]],
     ) -> pd.DataFrame:
         """Reverse the anonymization process."""
-        result = df.copy()
+        # Shallow copy: untouched columns share data with the input, and
+        # assigning a configured column replaces it only in the result
+        result = df.copy(deep=False)
 
         for field_name, field_config in config.items():
             if field_name not in df.columns:
@@ -153,9 +242,11 @@ class DeterministicAnonymizer:
                 result[field_name] = values - noise
 
             elif field_config["type"] == "text":
-                # Vectorize the text transformation
-                result[field_name] = df[field_name].apply(
-                    lambda x: self._text_transform(x, field_name, reverse=True),
+                # Transform the whole column in one pass
+                result[field_name] = self._text_transform_batch(
+                    df[field_name],
+                    field_name,
+                    reverse=True,
                 )
 
         return result
@@ -4,7 +4,6 @@ This module implements data anonymization through column shuffling using a key-b
 It provides functionality to generate fake data and perform reversible anonymization.
 """
 
-import json
 import random
 from typing import TypedDict
 
@@ -12,6 +11,19 @@ import numpy as np
 import pandas as pd
 from faker import Faker
 
+try:  # Numba is optional - without it every column is rotated with `take`
+    from numba import get_num_threads, njit, prange
+except ImportError:
+    get_num_threads = None
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+# Frames at least this long rotate their int64 columns on several threads;
+# below that (or on a single thread) `take` is just as fast
+PARALLEL_MIN_LENGTH = 65536
+
 
 class PersonData(TypedDict):
     """Structure representing a person's data."""
@@ -25,6 +37,105 @@ class PersonData(TypedDict):
     company: str
 
 
+class PeopleColumns(TypedDict):
+    """Column-oriented structure holding many people's data."""
+
+    country: list[str]
+    name: list[str]
+    age: np.ndarray
+    ssn: list[str]
+    height: np.ndarray
+    gender: np.ndarray
+    company: list[str]
+
+
+def _rotation_index(n: int, shift: int) -> np.ndarray:
+    """Build the row order of `np.roll` by `shift` for `n` rows.
+
+    The two ascending runs are concatenated directly, instead of
+    allocating `np.arange(n)` first and rolling a copy of it.
+
+    Args:
+        n: Number of rows
+        shift: Shift, as in `np.roll`
+
+    Returns:
+        Integer index array of length `n`
+
+    """
+    start = -shift % n
+    return np.concatenate((np.arange(start, n), np.arange(start)))
+
+
+def _rotate_values(values: np.ndarray, start: int) -> np.ndarray:
+    """Rotate a 1D array so that element `start` comes first.
+
+    Plain loop kernel, compiled with Numba as `_rotate_values_parallel`;
+    used for the int64 columns of large frames.
+
+    Args:
+        values: 1D array
+        start: Index of the element that becomes the first one
+
+    Returns:
+        New rotated array
+
+    """
+    n = values.shape[0]
+    out = np.empty_like(values)
+
+    for i in prange(n):
+        out[i] = values[(i + start) % n]
+
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _rotate_values_parallel = njit(parallel=True, cache=True)(_rotate_values)
+
+
+def _rotate_columns(
+    dane: pd.DataFrame,
+    shift_even: int,
+    shift_odd: int,
+) -> pd.DataFrame:
+    """Cyclically shift even and odd columns by different amounts.
+
+    The two row orders are computed once and every column is gathered with
+    its own array's `take`, which keeps column dtypes (rolling a
+    `to_numpy()` block of a mixed frame would turn everything into
+    objects). The result is built from a dict of arrays, so no copy of the
+    input frame is made. For large frames with Numba and several threads
+    available, int64 columns are rotated by the parallel kernel instead.
+
+    Args:
+        dane: Input DataFrame
+        shift_even: Shift for even columns, as in `np.roll`
+        shift_odd: Shift for odd columns, as in `np.roll`
+
+    Returns:
+        DataFrame with shifted columns, original column order and index
+
+    """
+    n = len(dane)
+    orders = (_rotation_index(n, shift_even), _rotation_index(n, shift_odd))
+    use_kernel = (
+        NUMBA_AVAILABLE and n >= PARALLEL_MIN_LENGTH and get_num_threads() > 1
+    )
+
+    columns = {}
+    for i, (_, column) in enumerate(dane.items()):
+        order = orders[i % 2]
+        if use_kernel and column.dtype == np.int64:
+            columns[i] = _rotate_values_parallel(column.to_numpy(), int(order[0]))
+        else:
+            columns[i] = column.array.take(order)
+
+    result = pd.DataFrame(columns, index=dane.index, copy=False)
+    result.columns = dane.columns
+    return result
+
+
 def anonimizacja(dane: pd.DataFrame, klucz: list[int]) -> pd.DataFrame:
     """Anonymize data by shuffling columns based on a key.
 
@@ -42,15 +153,7 @@ def anonimizacja(dane: pd.DataFrame, klucz: list[int]) -> pd.DataFrame:
     shift_a = klucz[0] % n
     shift_b = klucz[1] % n
 
-    result = dane.copy()
-    for i, col in enumerate(dane.columns):
-        values = dane[col].to_numpy()
-        if i % 2 == 0:
-            # Use numpy roll for efficient shifting
-            result[col] = np.roll(values, -shift_a)
-        else:
-            result[col] = np.roll(values, shift_b)
-    return result
+    return _rotate_columns(dane, -shift_a, shift_b)
 
 
 def deanonimizacja(dane: pd.DataFrame, klucz: list[int]) -> pd.DataFrame:
@@ -70,24 +173,21 @@ def deanonimizacja(dane: pd.DataFrame, klucz: list[int]) -> pd.DataFrame:
     shift_a = klucz[0] % n
     shift_b = klucz[1] % n
 
-    result = dane.copy()
-    for i, col in enumerate(dane.columns):
-        values = dane[col].to_numpy()
-        if i % 2 == 0:
-            result[col] = np.roll(values, shift_a)
-        else:
-            result[col] = np.roll(values, -shift_b)
-    return result
+    return _rotate_columns(dane, shift_a, -shift_b)
 
 
-def generate_fake_data() -> PersonData:
+def generate_fake_data(fake: Faker | None = None) -> PersonData:
     """Generate fake person data using Faker.
 
+    Args:
+        fake: Faker instance to use; a new one is created if not given
+
     Returns:
         Dictionary containing randomly generated person data
 
     """
-    fake = Faker()
+    if fake is None:
+        fake = Faker()
     return {
         "country": fake.country(),
         "name": fake.name(),
@@ -99,17 +199,34 @@ def generate_fake_data() -> PersonData:
     }
 
 
-def generowanie_wielu(num_records: int = 100) -> list[PersonData]:
-    """Generate multiple fake person records.
+def generowanie_wielu(
+    num_records: int = 100,
+    fake: Faker | None = None,
+) -> PeopleColumns:
+    """Generate multiple fake person records column by column.
+
+    Numeric and gender columns are drawn with one NumPy call each, and the
+    result can be passed straight to `pd.DataFrame`.
 
     Args:
         num_records: Number of records to generate
+        fake: Faker instance shared by all records; created once if not given
 
     Returns:
-        List of randomly generated person data dictionaries
+        Dictionary mapping column names to randomly generated values
 
     """
-    return [generate_fake_data() for _ in range(num_records)]
+    if fake is None:
+        fake = Faker()
+    return {
+        "country": [fake.country() for _ in range(num_records)],
+        "name": [fake.name() for _ in range(num_records)],
+        "age": np.random.randint(1, 101, size=num_records),
+        "ssn": [fake.ssn() for _ in range(num_records)],
+        "height": np.random.randint(140, 211, size=num_records),
+        "gender": np.random.choice(["M", "F"], size=num_records),
+        "company": [fake.company() for _ in range(num_records)],
+    }
 
 
 # Test code
@@ -117,11 +234,8 @@ if __name__ == "__main__":
     klucz: list[int] = [3, 13]
     fake = Faker()
 
-    people_data: list[PersonData] = generowanie_wielu(1000)
-    with open("people_data.json", "w") as file:
-        json.dump(people_data, file, indent=4, default=str)
-
-    df = pd.read_json("people_data.json")
+    people_data: PeopleColumns = generowanie_wielu(1000, fake)
+    df = pd.DataFrame(people_data, copy=False)
     anon = anonimizacja(df.copy(), klucz)
     print(df.head(10), "\n\n-----------------------------\n")
     print(
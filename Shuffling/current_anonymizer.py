@@ -5,13 +5,25 @@ independently using a two-element key. Specifically designed for handling
 personal data with special focus on names and SSN numbers.
 """
 
-import json
 import random
+from functools import cache
 from typing import TypedDict
 
+import numpy as np
 import pandas as pd
 from faker import Faker
 
+try:  # PyArrow is optional - with it Arrow string columns are split in C++
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+PYARROW_AVAILABLE = pa is not None
+
+STRING_COLUMNS = ["country", "name", "ssn", "gender", "company"]
+
 
 class PersonData(TypedDict):
     """Structure representing a person's data record."""
@@ -25,6 +37,158 @@ class PersonData(TypedDict):
     company: str
 
 
+class PeopleColumns(TypedDict):
+    """Column-oriented structure holding many people's data records."""
+
+    country: list[str]
+    name: list[str]
+    age: np.ndarray
+    ssn: list[str]
+    height: np.ndarray
+    gender: np.ndarray
+    company: list[str]
+
+
+@cache
+def _faker_pools() -> tuple[Faker, list[str], list[str]]:
+    """Create the shared Faker instance and its value pools on first use.
+
+    Returns:
+        Tuple of (Faker instance, country names, sampled company names)
+
+    """
+    fake = Faker()
+    countries = list(fake.provider("faker.providers.address").countries)
+    companies = [fake.company() for _ in range(2048)]
+    return fake, countries, companies
+
+
+def _is_arrow_string(column: pd.Series) -> bool:
+    """Check whether a column stores its strings in an Arrow buffer."""
+    return (
+        PYARROW_AVAILABLE
+        and isinstance(column.dtype, pd.StringDtype)
+        and column.dtype.storage == "pyarrow"
+    )
+
+
+def _split_columns(dane: pd.DataFrame) -> None:
+    """Split 'name' into first/last name and 'ssn' into two halves in place.
+
+    Arrow-backed string columns are split with `pyarrow.compute` kernels
+    (a regex match for names, so names without a space don't fail);
+    otherwise with comprehensions over the underlying arrays. Missing
+    values stay missing.
+    """
+    name = dane["name"]
+    ssn = dane["ssn"]
+    if _is_arrow_string(name) and _is_arrow_string(ssn):
+        names = pa.array(name)
+        # Rows without a space don't match: they keep the whole name as the
+        # first name and get a null last name
+        parts = pc.extract_regex(names, r"(?s)^(?P<first>[^ ]*) (?P<last>.*)$")
+        first = pc.coalesce(pc.struct_field(parts, "first"), names)
+        dane["name"] = pd.array(first, dtype=name.dtype)
+        dane["last name"] = pd.array(
+            pc.struct_field(parts, "last"),
+            dtype=name.dtype,
+        )
+        ssn_arr = pa.array(ssn)
+        dane["ssn_1"] = pd.array(
+            pc.utf8_slice_codeunits(ssn_arr, 0, 5),
+            dtype=ssn.dtype,
+        )
+        dane["ssn_2"] = pd.array(
+            pc.utf8_slice_codeunits(ssn_arr, 5),
+            dtype=ssn.dtype,
+        )
+        return
+
+    # Missing names pass through; a name without a space has no last name
+    names = [
+        value.split(" ", 1) if isinstance(value, str) else [value]
+        for value in name.to_numpy()
+    ]
+    dane["name"] = [parts[0] for parts in names]
+    dane["last name"] = [parts[1] if len(parts) > 1 else None for parts in names]
+    ssn_values = ssn.to_numpy()
+    dane["ssn_1"] = [
+        value[:5] if isinstance(value, str) else value for value in ssn_values
+    ]
+    dane["ssn_2"] = [
+        value[5:] if isinstance(value, str) else value for value in ssn_values
+    ]
+
+
+def _join_columns(dane: pd.DataFrame) -> None:
+    """Reverse `_split_columns`: rebuild 'name' and 'ssn' in place."""
+    if all(
+        _is_arrow_string(dane[column])
+        for column in ("name", "last name", "ssn_1", "ssn_2")
+    ):
+        name_dtype = dane["name"].dtype
+        first = pa.array(dane["name"])
+        separator = pa.scalar(" ", type=first.type)
+        empty = pa.scalar("", type=first.type)
+        dane["ssn"] = pd.array(
+            pc.binary_join_element_wise(
+                pa.array(dane["ssn_1"]), pa.array(dane["ssn_2"]), empty
+            ),
+            dtype=dane["ssn"].dtype,
+        )
+        dane["name"] = pd.array(
+            pc.binary_join_element_wise(first, pa.array(dane["last name"]), separator),
+            dtype=name_dtype,
+        )
+    else:
+        dane["ssn"] = [
+            first + second
+            if isinstance(first, str) and isinstance(second, str)
+            else None
+            for first, second in zip(
+                dane["ssn_1"].to_numpy(), dane["ssn_2"].to_numpy()
+            )
+        ]
+        dane["name"] = [
+            f"{first} {last}"
+            if isinstance(first, str) and isinstance(last, str)
+            else None
+            for first, last in zip(
+                dane["name"].to_numpy(), dane["last name"].to_numpy()
+            )
+        ]
+
+    dane.drop(columns=["ssn_1", "ssn_2", "last name"], inplace=True)
+
+
+def _rotate(
+    column: pd.Series,
+    start: int,
+) -> np.ndarray | pd.api.extensions.ExtensionArray:
+    """Cyclically shift a column so that the value at `start` comes first.
+
+    NumPy-backed columns are copied in two slices into one preallocated
+    buffer; extension arrays (pandas/Arrow strings) are gathered with their
+    own `take`, which keeps the values in their native storage.
+
+    Args:
+        column: Column to shift
+        start: Position of the value that becomes the first one
+
+    Returns:
+        Shifted values, ready to be assigned back to the frame
+
+    """
+    n = len(column)
+    if isinstance(column.dtype, np.dtype):
+        values = column.to_numpy()
+        out = np.empty_like(values)
+        out[: n - start] = values[start:]
+        out[n - start :] = values[:start]
+        return out
+    return column.array.take(np.r_[start:n, 0:start])
+
+
 def anonimizacja(dane: pd.DataFrame, klucz: list[int]) -> pd.DataFrame:
     """Anonymize data by splitting and shifting name and SSN columns.
 
@@ -36,50 +200,27 @@ def anonimizacja(dane: pd.DataFrame, klucz: list[int]) -> pd.DataFrame:
         DataFrame with anonymized name and SSN values
 
     """
-    klucz[0] = klucz[0] % len(dane)
-    klucz[1] = klucz[1] % len(dane)
+    n = len(dane)
+    k0 = klucz[0] % n
+    k1 = klucz[1] % n
+    start_first = k0
+    start_last = -k1 % n
     # podział danych
-    dane[["name", "last name"]] = dane["name"].str.split(" ", n=1, expand=True)
-    dane["ssn_1"] = dane["ssn"].str[:5]
-    dane["ssn_2"] = dane["ssn"].str[5:]
+    _split_columns(dane)
 
     # imię
-    dane["name"] = pd.concat(
-        [
-            dane["name"].iloc[klucz[0] :],
-            dane["name"].iloc[: klucz[0]],
-        ],
-    ).reset_index(drop=True)
+    dane["name"] = _rotate(dane["name"], start_first)
 
     # nazwisko
-    dane["last name"] = pd.concat(
-        [
-            dane["last name"].iloc[-klucz[1] :],
-            dane["last name"].iloc[: -klucz[1]],
-        ],
-    ).reset_index(drop=True)
+    dane["last name"] = _rotate(dane["last name"], start_last)
 
     # ssn_1
-    dane["ssn_1"] = pd.concat(
-        [
-            dane["ssn_1"].iloc[klucz[0] :],
-            dane["ssn_1"].iloc[: klucz[0]],
-        ],
-    ).reset_index(drop=True)
+    dane["ssn_1"] = _rotate(dane["ssn_1"], start_first)
 
     # ssn_2
-    dane["ssn_2"] = pd.concat(
-        [
-            dane["ssn_2"].iloc[-klucz[1] :],
-            dane["ssn_2"].iloc[: -klucz[1]],
-        ],
-    ).reset_index(drop=True)
-
-    dane["ssn"] = dane["ssn_1"] + dane["ssn_2"]
-    dane.drop(["ssn_1", "ssn_2"], axis=1, inplace=True)
+    dane["ssn_2"] = _rotate(dane["ssn_2"], start_last)
 
-    dane["name"] = dane["name"] + " " + dane["last name"]
-    dane.drop(columns=["last name"], inplace=True)
+    _join_columns(dane)
 
     return dane
 
@@ -95,50 +236,27 @@ def deanonimizacja(dane: pd.DataFrame, klucz: list[int]) -> pd.DataFrame:
         DataFrame with restored original values
 
     """
-    klucz[0] = klucz[0] % len(dane)
-    klucz[1] = klucz[1] % len(dane)
+    n = len(dane)
+    k0 = klucz[0] % n
+    k1 = klucz[1] % n
+    start_first = -k0 % n
+    start_last = k1
     # podział danych
-    dane[["name", "last name"]] = dane["name"].str.split(" ", n=1, expand=True)
-    dane["ssn_1"] = dane["ssn"].str[:5]
-    dane["ssn_2"] = dane["ssn"].str[5:]
+    _split_columns(dane)
 
     # imię
-    dane["name"] = pd.concat(
-        [
-            dane["name"].iloc[-klucz[0] :],
-            dane["name"].iloc[: -klucz[0]],
-        ],
-    ).reset_index(drop=True)
+    dane["name"] = _rotate(dane["name"], start_first)
 
     # nazwisko
-    dane["last name"] = pd.concat(
-        [
-            dane["last name"].iloc[klucz[1] :],
-            dane["last name"].iloc[: klucz[1]],
-        ],
-    ).reset_index(drop=True)
+    dane["last name"] = _rotate(dane["last name"], start_last)
 
     # ssn_1
-    dane["ssn_1"] = pd.concat(
-        [
-            dane["ssn_1"].iloc[-klucz[0] :],
-            dane["ssn_1"].iloc[: -klucz[0]],
-        ],
-    ).reset_index(drop=True)
+    dane["ssn_1"] = _rotate(dane["ssn_1"], start_first)
 
     # ssn_2
-    dane["ssn_2"] = pd.concat(
-        [
-            dane["ssn_2"].iloc[klucz[1] :],
-            dane["ssn_2"].iloc[: klucz[1]],
-        ],
-    ).reset_index(drop=True)
-
-    dane["ssn"] = dane["ssn_1"] + dane["ssn_2"]
-    dane.drop(["ssn_1", "ssn_2"], axis=1, inplace=True)
+    dane["ssn_2"] = _rotate(dane["ssn_2"], start_last)
 
-    dane["name"] = dane["name"] + " " + dane["last name"]
-    dane.drop(columns=["last name"], inplace=True)
+    _join_columns(dane)
 
     return dane
 
@@ -146,44 +264,59 @@ def deanonimizacja(dane: pd.DataFrame, klucz: list[int]) -> pd.DataFrame:
 def generate_fake_data() -> PersonData:
     """Generate a single record of fake personal data.
 
+    Countries and companies are drawn from pools sampled once on first use,
+    and the SSN is formatted directly, so no Faker provider runs per record.
+
     Returns:
         Dictionary containing randomly generated person information
 
     """
-    fake = Faker()
+    fake, countries, companies = _faker_pools()
     return {
-        "country": fake.country(),
+        "country": random.choice(countries),
         "name": fake.name(),
         "age": random.randint(1, 100),
-        "ssn": fake.ssn(),
+        "ssn": f"{random.randint(1, 899):03d}-{random.randint(1, 99):02d}-"
+        f"{random.randint(1, 9999):04d}",
         "height": random.randint(140, 210),
         "gender": random.choice(["M", "F"]),
-        "company": fake.company(),
+        "company": random.choice(companies),
     }
 
 
-def generowanie_wielu(num_records: int = 100) -> list[PersonData]:
-    """Generate multiple fake person records.
+def generowanie_wielu(num_records: int = 100) -> PeopleColumns:
+    """Generate multiple fake person records column by column.
 
     Args:
         num_records: Number of records to generate
 
     Returns:
-        List of randomly generated person data dictionaries
+        Dictionary mapping column names to randomly generated values
 
     """
-    return [generate_fake_data() for _ in range(num_records)]
+    fake, countries, companies = _faker_pools()
+    area = np.random.randint(1, 900, size=num_records).tolist()
+    group = np.random.randint(1, 100, size=num_records).tolist()
+    serial = np.random.randint(1, 10000, size=num_records).tolist()
+    return {
+        "country": random.choices(countries, k=num_records),
+        "name": [fake.name() for _ in range(num_records)],
+        "age": np.random.randint(1, 101, size=num_records),
+        "ssn": [
+            f"{a:03d}-{g:02d}-{s:04d}" for a, g, s in zip(area, group, serial)
+        ],
+        "height": np.random.randint(140, 211, size=num_records),
+        "gender": np.random.choice(["M", "F"], size=num_records),
+        "company": random.choices(companies, k=num_records),
+    }
 
 
 if __name__ == "__main__":
     klucz: list[int] = [1, 3]
-    fake = Faker()
-
-    people_data: list[PersonData] = generowanie_wielu(10)
-    with open("people_data.json", "w") as file:
-        json.dump(people_data, file, indent=4, default=str)
-
-    df: pd.DataFrame = pd.read_json("people_data.json")
+    people_data: PeopleColumns = generowanie_wielu(10)
+    df: pd.DataFrame = pd.DataFrame(people_data, copy=False)
+    if PYARROW_AVAILABLE:
+        df[STRING_COLUMNS] = df[STRING_COLUMNS].astype("string[pyarrow]")
     anon: pd.DataFrame = anonimizacja(df.copy(), klucz)
 
     print(df.head(), "\nprzerwa\n")
@@ -1,10 +1,11 @@
 """Performance testing module for various anonymization methods."""
 
 import argparse
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Callable
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
@@ -25,45 +26,101 @@ def generate_test_data(size: int) -> pd.DataFrame:
         DataFrame with test data
 
     """
+    ids = np.arange(size)
     return pd.DataFrame(
         {
-            "name": ["Test" + str(i) for i in range(size)],
+            "name": np.char.add("Test", ids.astype(str)),
             "age": np.random.randint(18, 80, size),
-            "credit_card_number": [
-                "4532" + str(i).zfill(12) for i in range(size)
-            ],
-            "zip_code": ["1234" + str(i)[-1] for i in range(size)],
+            # "4532" followed by the zero-padded 12-digit row number
+            "credit_card_number": (4532 * 10**12 + ids).astype(str),
+            "zip_code": np.char.add("1234", (ids % 10).astype("U1")),
             "blood_sugar": np.random.normal(100, 10, size),
         },
     )
 
 
-def get_anonymizer(method: str) -> tuple[Callable, Callable, Any]:
+def get_anonymizer(method: str) -> tuple[Callable, Callable, Any, bool]:
     """Get anonymization and deanonymization functions based on method.
 
     Args:
         method: Name of the anonymization method ('deterministic', 'shuffle', 'bitwise')
 
     Returns:
-        Tuple of (anonymize_fn, deanonymize_fn, config_or_key_or_None)
+        Tuple of (anonymize_fn, deanonymize_fn, config_or_key_or_None,
+        mutates_input). None of the current methods modify their input
+        frame, so the benchmark can reuse one frame for all trials.
 
     """
     match method:
         case "deterministic":
             anonymizer = DeterministicAnonymizer(key="SecretKey#123")
-            return anonymizer.anonymize, anonymizer.deanonymize, config
+            return anonymizer.anonymize, anonymizer.deanonymize, config, False
         case "shuffle":
-            return shuffle_anonymize, shuffle_deanonymize, [7, 13]
+            return shuffle_anonymize, shuffle_deanonymize, [7, 13], False
         case "bitwise":
             anonymizer = TypeAwareDualKeyAnonymizer(
                 primary_key="SecretKey#123",
                 secondary_key="SecretKet@987",
             )
-            return anonymizer.anonymize, anonymizer.deanonymize, None
+            return anonymizer.anonymize, anonymizer.deanonymize, None, False
         case _:
             raise ValueError(f"Unknown anonymization method: {method}")
 
 
+def run_trial(
+    df: pd.DataFrame,
+    anonymize_fn: Callable,
+    deanonymize_fn: Callable,
+    config: Any,
+    anon_method: str = "deterministic",
+) -> tuple[float, float]:
+    """Time a single anonymization and deanonymization round trip.
+
+    Args:
+        df: Test data
+        anonymize_fn: Anonymization function
+        deanonymize_fn: Deanonymization function
+        config: Configuration for the anonymization method
+        anon_method: Name of the anonymization method being tested
+
+    Returns:
+        Tuple of (anonymization_time, deanonymization_time) in seconds
+
+    """
+    if anon_method.lower() == "bitwise":
+        # For bitwise, each value becomes a token: anonymize column by
+        # column over plain Python values instead of cell-wise df.map
+        start = time.perf_counter_ns()
+        anonymized = pd.DataFrame(
+            {
+                column: [anonymize_fn(value) for value in df[column].tolist()]
+                for column in df.columns
+            },
+            index=df.index,
+        )
+        time_anon = (time.perf_counter_ns() - start) * 1e-9
+
+        start = time.perf_counter_ns()
+        pd.DataFrame(
+            {
+                column: [deanonymize_fn(value) for value in anonymized[column].tolist()]
+                for column in anonymized.columns
+            },
+            index=anonymized.index,
+        )
+        time_deanon = (time.perf_counter_ns() - start) * 1e-9
+    else:
+        start = time.perf_counter_ns()
+        anonymized = anonymize_fn(df, config)
+        time_anon = (time.perf_counter_ns() - start) * 1e-9
+
+        start = time.perf_counter_ns()
+        deanonymize_fn(anonymized, config)
+        time_deanon = (time.perf_counter_ns() - start) * 1e-9
+
+    return time_anon, time_deanon
+
+
 def measure_performance(
     sizes: list[int],
     anonymize_fn: Callable,
@@ -71,6 +128,7 @@ def measure_performance(
     config: Any,
     num_trials: int = 3,
     anon_method: str = "deterministic",
+    mutates_input: bool = False,
 ) -> tuple[list[float], list[float]]:
     """Measure performance of anonymization functions.
 
@@ -81,6 +139,8 @@ def measure_performance(
         config: Configuration for the anonymization method
         num_trials: Number of trials for each size
         anon_method: Name of the anonymization method being tested
+        mutates_input: Whether anonymize_fn modifies the frame it is given;
+            if so, every trial gets its own shallow copy
 
     Returns:
         Tuple of (anonymization_times, deanonymization_times)
@@ -90,34 +150,70 @@ def measure_performance(
     times_deanonymize: list[float] = []
 
     for size in sizes:
-        anonymization_times: list[float] = []
-        deanonymization_times: list[float] = []
+        # Generated once per size and shared by the trials
+        df = generate_test_data(size)
+        anonymization_times, deanonymization_times = zip(
+            *(
+                run_trial(
+                    df.copy(deep=False) if mutates_input else df,
+                    anonymize_fn,
+                    deanonymize_fn,
+                    config,
+                    anon_method,
+                )
+                for _ in range(num_trials)
+            ),
+        )
 
-        for _ in range(num_trials):
-            df = generate_test_data(size)
+        # The fastest trial is the least disturbed by caches, GC and scheduling
+        times_anonymize.append(min(anonymization_times))
+        times_deanonymize.append(min(deanonymization_times))
+
+    return times_anonymize, times_deanonymize
 
-            if anon_method.lower() == "bitwise":
-                # For bitwise, we need to handle each column separately and convert to string
-                start = time.time()
-                anonymized = df.map(anonymize_fn)
 
-                anonymization_times.append(time.time() - start)
+def _run_parallel_trial(size: int, anon_method: str) -> tuple[float, float]:
+    """Worker for `measure_performance_parallel`: one trial in its own process.
+
+    The anonymizer and the data are created in the worker, so no frames
+    have to be pickled between processes.
+    """
+    anonymize_fn, deanonymize_fn, config, _ = get_anonymizer(anon_method)
+    df = generate_test_data(size)
+    return run_trial(df, anonymize_fn, deanonymize_fn, config, anon_method)
+
+
+def measure_performance_parallel(
+    sizes: list[int],
+    num_trials: int = 3,
+    anon_method: str = "deterministic",
+) -> tuple[list[float], list[float]]:
+    """Measure performance with every (size, trial) pair in a separate process.
+
+    Faster to finish than `measure_performance`, but the trials compete for
+    CPU and memory bandwidth, so the timings are noisier.
 
-                start = time.time()
-                original = anonymized.map(deanonymize_fn)
+    Args:
+        sizes: List of dataset sizes to test
+        num_trials: Number of trials for each size
+        anon_method: Name of the anonymization method being tested
 
-                deanonymization_times.append(time.time() - start)
-            else:
-                start = time.time()
-                anonymized = anonymize_fn(df, config)
-                anonymization_times.append(time.time() - start)
+    Returns:
+        Tuple of (anonymization_times, deanonymization_times)
 
-                start = time.time()
-                original = deanonymize_fn(anonymized, config)
-                deanonymization_times.append(time.time() - start)
+    """
+    jobs = [size for size in sizes for _ in range(num_trials)]
+    with ProcessPoolExecutor() as executor:
+        results = list(
+            executor.map(_run_parallel_trial, jobs, [anon_method] * len(jobs)),
+        )
 
-        times_anonymize.append(np.mean(anonymization_times))
-        times_deanonymize.append(np.mean(deanonymization_times))
+    times_anonymize: list[float] = []
+    times_deanonymize: list[float] = []
+    for i in range(len(sizes)):
+        trials = results[i * num_trials : (i + 1) * num_trials]
+        times_anonymize.append(min(time_anon for time_anon, _ in trials))
+        times_deanonymize.append(min(time_deanon for _, time_deanon in trials))
 
     return times_anonymize, times_deanonymize
 
@@ -127,17 +223,40 @@ def plot_results(
     times_anon: list[float],
     times_deanon: list[float],
     method: str,
-) -> None:
-    """Plot performance results and save to file."""
-    plt.figure(figsize=(10, 6))
-    plt.plot(sizes, times_anon, "b-", label="Anonymization")
-    plt.plot(sizes, times_deanon, "r-", label="Deanonymization")
+) -> threading.Thread:
+    """Plot performance results and save to file.
+
+    Matplotlib is imported here, so the timings can be collected without
+    paying for its import first. The figure is written in a background
+    thread; join the returned thread before exiting.
+
+    Args:
+        sizes: List of dataset sizes that were tested
+        times_anon: Anonymization times in seconds
+        times_deanon: Deanonymization times in seconds
+        method: Name of the anonymization method
+
+    Returns:
+        Started thread saving the figure
+
+    """
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(10, 6))
+    plt.plot(sizes, [t * 1000 for t in times_anon], "b-", label="Anonymization")
+    plt.plot(sizes, [t * 1000 for t in times_deanon], "r-", label="Deanonymization")
     plt.xlabel("Dataset Size")
     plt.ylabel("Time (milliseconds)")
     plt.title(f"Performance Analysis - {method.title()} Method")
     plt.legend()
     plt.grid(True)
-    plt.savefig(f"performance_analysis_{method}.png")
+
+    saver = threading.Thread(
+        target=fig.savefig,
+        args=(f"performance_analysis_{method}.png",),
+    )
+    saver.start()
+    return saver
 
 
 def main() -> None:
@@ -160,19 +279,35 @@ def main() -> None:
         default=[100, 1000, 5000, 10000, 50000, 100000],
         help="Dataset sizes to test",
     )
+    parser.add_argument(
+        "--parallel",
+        "-p",
+        action="store_true",
+        help="Run trials in parallel processes (faster, but noisier timings)",
+    )
     args = parser.parse_args()
 
-    anonymize_fn, deanonymize_fn, config = get_anonymizer(args.method)
-    times_anon, times_deanon = measure_performance(
-        args.sizes,
-        anonymize_fn,
-        deanonymize_fn,
-        config,
-        num_trials=3,
-        anon_method=args.method,
-    )
+    if args.parallel:
+        times_anon, times_deanon = measure_performance_parallel(
+            args.sizes,
+            num_trials=3,
+            anon_method=args.method,
+        )
+    else:
+        anonymize_fn, deanonymize_fn, config, mutates_input = get_anonymizer(
+            args.method,
+        )
+        times_anon, times_deanon = measure_performance(
+            args.sizes,
+            anonymize_fn,
+            deanonymize_fn,
+            config,
+            num_trials=3,
+            anon_method=args.method,
+            mutates_input=mutates_input,
+        )
 
-    plot_results(args.sizes, times_anon, times_deanon, args.method)
+    saver = plot_results(args.sizes, times_anon, times_deanon, args.method)
 
     # Print performance metrics
     print(f"\nPerformance Analysis for {args.method.title()} Method:")
@@ -185,6 +320,8 @@ def main() -> None:
             f"Size: {size} -> Anonymization: {time_anon:.5f}s, Deanonymization: {time_deanon:.5f}s",
         )
 
+    saver.join()
+
 
 if __name__ == "__main__":
     main()